@@ -0,0 +1,115 @@
+"""A calendar platform for Zenkit."""
+
+import logging
+import datetime
+
+from typing import Any
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import ZenkitDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> bool:
+    """Set up the Zenkit calendar platform config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    lists = await coordinator.async_get_lists()
+    if lists is None:
+        _LOGGER.warning("No lists found")
+        return False
+
+    calendarEntities = []
+    for list in lists:
+        calendarEntities.append(
+            ZenkitCalendarEntity(
+                coordinator,
+                list["shortId"],
+                list["uuid"],
+                list["name"],
+            )
+        )
+
+    async_add_entities(calendarEntities)
+
+    if not calendarEntities:
+        _LOGGER.warning("No calendars added")
+        return False
+
+    return True
+
+
+def _calendar_event(due_date: datetime.date, item: dict[str, Any]) -> CalendarEvent:
+    """Get an all-day calendar event of an item due on the given date."""
+    return CalendarEvent(
+        start=due_date,
+        end=due_date + datetime.timedelta(days=1),
+        summary=item["displayString"],
+        uid=item["uuid"],
+    )
+
+
+class ZenkitCalendarEntity(
+    CoordinatorEntity[ZenkitDataUpdateCoordinator], CalendarEntity
+):
+    """An Zenkit CalendarEntity showing list entries by due date."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: ZenkitDataUpdateCoordinator,
+        list_short_id: str,
+        list_uuid: str,
+        list_name: str,
+    ) -> None:
+        """Initialize ZenkitCalendarEntity."""
+        super().__init__(coordinator=coordinator)
+        self.list_short_id = list_short_id
+        self.list_uuid = list_uuid
+
+        self._attr_unique_id = list_uuid
+        self._attr_name = list_name
+
+        _LOGGER.debug("Created calendar %s (%s)", list_short_id, list_name)
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the next upcoming event."""
+        due_entry = self.coordinator.next_due_entry(
+            self.list_short_id, dt_util.now().date()
+        )
+        if due_entry is None:
+            return None
+        return _calendar_event(*due_entry)
+
+    async def async_get_events(
+        self,
+        hass: HomeAssistant,
+        start_date: datetime.datetime,
+        end_date: datetime.datetime,
+    ) -> list[CalendarEvent]:
+        """Return calendar events within a datetime range."""
+        # all-day events overlap the range if due from the start day up to the end day
+        start = dt_util.as_local(start_date).date()
+        end_date = dt_util.as_local(end_date)
+        end = end_date.date()
+        if end_date.time() != datetime.time.min:
+            end += datetime.timedelta(days=1)
+
+        return [
+            _calendar_event(due_date, entry)
+            for due_date, entry in self.coordinator.due_entries(
+                self.list_short_id, start, end
+            )
+        ]
@@ -2,19 +2,62 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, insort
+import datetime
 from datetime import timedelta
 import logging
+from typing import Any
 
 from custom_components.zenkit.exceptions import UpdateFailedException
+from homeassistant.components.todo import TodoItemStatus
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .const import DOMAIN, UPDATE_INTERVAL
+from .const import DOMAIN, DUE_DATE_FORMAT, UPDATE_INTERVAL
 from .api import Zenkit
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _completion_status(item: dict[str, Any]) -> TodoItemStatus:
+    """Get the state of by sort field item."""
+    """
+    Example completion status field, name is translated
+    "fd3bb8c3-07a5-424f-9bb0-82ab022f2e24_categories_sort": [
+        {
+            "id": 12691260,
+            "uuid": "9b30d1a2-6951-4e83-ab5f-46626ee8d53e",
+            "name": "Completed",
+            "colorHex": "#3ba744"
+        }
+    ],
+    """
+    for f, field in item.items():
+        if f.endswith("_categories_sort"):
+            for category in field:
+                if category["colorHex"] == "#3ba744":
+                    return TodoItemStatus.COMPLETED
+    return TodoItemStatus.NEEDS_ACTION
+
+
+def _due_date_fields(entry: dict) -> tuple[str, ...]:
+    """Get the raw values of all date fields of an entry."""
+    # Zenkit does not have a due date field, so we use the first date field ending with _date as key
+    return tuple(
+        field for f, field in entry.items() if f.endswith("_date") and field is not None
+    )
+
+
+def _parse_due_date(fields: tuple[str, ...]) -> datetime.date | None:
+    """Parse the first valid due date of the raw date fields."""
+    for field in fields:
+        try:
+            return datetime.datetime.strptime(field, DUE_DATE_FORMAT).date()
+        except ValueError:
+            _LOGGER.warning("Unable to parse due date %s", field)
+    return None
+
+
 class ZenkitDataUpdateCoordinator(DataUpdateCoordinator[dict]):
     """Class to manage fetching Zenkit data."""
 
@@ -29,6 +72,13 @@ class ZenkitDataUpdateCoordinator(DataUpdateCoordinator[dict]):
         )
         self.zk = zk
         self._lists: dict = None
+        self._entries: dict[str, dict] = {}
+        # entry uuid -> (list short id, raw date fields, status, parsed due date)
+        self._due_dates: dict[
+            str, tuple[str, tuple[str, ...], TodoItemStatus, datetime.date | None]
+        ] = {}
+        # list short id -> open entries with due date sorted as (due date, entry uuid)
+        self._due_index: dict[str, list[tuple[datetime.date, str]]] = {}
 
     async def _async_update_data(self) -> dict:
         """Fetch items from Zenkit."""
@@ -53,6 +103,8 @@ class ZenkitDataUpdateCoordinator(DataUpdateCoordinator[dict]):
                         list_shortId,
                     ) from error
                 lists_entries[list_shortId] = list_entries
+
+        self._update_due_index(lists_entries)
         return lists_entries
 
     async def async_get_lists(self) -> dict:
@@ -60,3 +112,72 @@ class ZenkitDataUpdateCoordinator(DataUpdateCoordinator[dict]):
         if self._lists is None:
             self._lists = await self.zk.get_lists()
         return self._lists
+
+    def due_date(self, entry_uuid: str) -> datetime.date | None:
+        """Return the due date of an entry from the due date index."""
+        if (due_date := self._due_dates.get(entry_uuid)) is None:
+            return None
+        return due_date[3]
+
+    def due_entries(
+        self, list_short_id: str, start: datetime.date, end: datetime.date
+    ) -> list[tuple[datetime.date, dict]]:
+        """Return entries of a list due from start (inclusive) to end (exclusive)."""
+        index = self._due_index.get(list_short_id, [])
+        lo = bisect_left(index, (start,))
+        hi = bisect_left(index, (end,), lo)
+        return [(due, self._entries[uid]) for due, uid in index[lo:hi]]
+
+    def next_due_entry(
+        self, list_short_id: str, start: datetime.date
+    ) -> tuple[datetime.date, dict] | None:
+        """Return the first entry of a list due on or after start."""
+        index = self._due_index.get(list_short_id, [])
+        i = bisect_left(index, (start,))
+        if i == len(index):
+            return None
+        due, uid = index[i]
+        return due, self._entries[uid]
+
+    def _update_due_index(self, lists_entries: dict) -> None:
+        """Update the due date index of open entries, parsing only new or changed entries."""
+        entries = dict()
+        for list_short_id, list_entries in lists_entries.items():
+            index = self._due_index.setdefault(list_short_id, [])
+            for entry in list_entries:
+                uid = entry["uuid"]
+                entries[uid] = entry
+
+                fields = _due_date_fields(entry)
+                status = _completion_status(entry)
+                cached = self._due_dates.get(uid)
+                if cached is not None:
+                    if cached[:3] == (list_short_id, fields, status):
+                        continue
+                    self._remove_from_due_index(uid, cached[0], cached[3])
+
+                # completing an entry does not touch its date fields
+                if cached is not None and cached[1] == fields:
+                    due = cached[3]
+                else:
+                    due = _parse_due_date(fields)
+                self._due_dates[uid] = (list_short_id, fields, status, due)
+                if due is not None and status != TodoItemStatus.COMPLETED:
+                    insort(index, (due, uid))
+
+        for uid in self._due_dates.keys() - entries.keys():
+            list_short_id, _, _, due = self._due_dates.pop(uid)
+            self._remove_from_due_index(uid, list_short_id, due)
+
+        self._entries = entries
+
+    def _remove_from_due_index(
+        self, entry_uuid: str, list_short_id: str, due: datetime.date | None
+    ) -> None:
+        """Remove an entry from the due date index."""
+        if due is None:
+            return
+        index = self._due_index[list_short_id]
+        i = bisect_left(index, (due, entry_uuid))
+        if i < len(index) and index[i] == (due, entry_uuid):
+            del index[i]
@@ -1,7 +1,6 @@
 """A todo platform for Zenkit."""
 
 import logging
-import datetime
 import uuid
 
 from typing import Any
@@ -17,8 +16,8 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, DUE_DATE_FORMAT
-from .coordinator import ZenkitDataUpdateCoordinator
+from .const import DOMAIN
+from .coordinator import ZenkitDataUpdateCoordinator, _completion_status
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -95,27 +94,6 @@ def _list_icon(list: dict[str, Any]) -> str | None:
     return f"mdi:{class_name}"
 
 
-def _completion_status(item: dict[str, Any]) -> TodoItemStatus:
-    """Get the state of by sort field item."""
-    """
-    Example completion status field, name is translated
-    "fd3bb8c3-07a5-424f-9bb0-82ab022f2e24_categories_sort": [
-        {
-            "id": 12691260,
-            "uuid": "9b30d1a2-6951-4e83-ab5f-46626ee8d53e",
-            "name": "Completed",
-            "colorHex": "#3ba744"
-        }
-    ],
-    """
-    for f, field in item.items():
-        if f.endswith("_categories_sort"):
-            for category in field:
-                if category["colorHex"] == "#3ba744":
-                    return TodoItemStatus.COMPLETED
-    return TodoItemStatus.NEEDS_ACTION
-
-
 def _description(item: dict[str, Any]) -> str | None:
     """Get the description of by text field."""
     # Zenkit does not have a description field, so we use the first text field ending with _text as key
@@ -125,19 +103,6 @@ def _description(item: dict[str, Any]) -> str | None:
     return None
 
 
-def _due_date(item: dict[str, Any]) -> str | None:
-    """Get the due date of by date field."""
-    # Zenkit does not have a due date field, so we use the first date field ending with _date as key
-    for f, field in item.items():
-        if f.endswith("_date") and field is not None:
-            try:
-                due_datetime = datetime.datetime.strptime(field, DUE_DATE_FORMAT)
-                return due_datetime.date()
-            except ValueError:
-                _LOGGER.warning("Unable to parse due date %s", field)
-    return None
-
-
 class ZenkitTodoListEntity(
     CoordinatorEntity[ZenkitDataUpdateCoordinator], TodoListEntity
 ):
@@ -192,7 +157,7 @@ class ZenkitTodoListEntity(
                     summary=entry["displayString"],
                     status=status,
                     description=_description(entry),
-                    due=_due_date(entry),
+                    due=self.coordinator.due_date(entry["uuid"]),
                 )
             )
         self._attr_todo_items = list(items)